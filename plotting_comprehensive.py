@@ -6,11 +6,17 @@ across different dimensions, sizes, and distributions.
 """
 
 import pandas as pd
+import pyarrow as pa
+import matplotlib
+# Render off-screen with Agg; only PNG files are produced
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 import numpy as np
 import glob
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 from matplotlib.ticker import ScalarFormatter
 import matplotlib.gridspec as gridspec
 
@@ -21,6 +27,8 @@ sns.set_palette("colorblind")
 # Constants
 IMAGES_DIR = "benchmark_charts"
 DPI = 300
+# The 24x20 inch dashboard at 300 DPI is a 7200x6000 px image; 150 DPI is plenty on screen
+DASHBOARD_DPI = 150
 SMALL_SIZE = 10
 MEDIUM_SIZE = 12
 BIGGER_SIZE = 14
@@ -35,10 +43,25 @@ plt.rc('ytick', labelsize=SMALL_SIZE)
 plt.rc('legend', fontsize=SMALL_SIZE)
 plt.rc('figure', titlesize=TITLE_SIZE)
 
+# Columns stored as categoricals so groupbys hash integer codes instead of strings
+CATEGORICAL_COLUMNS = ('Algorithm', 'Dimension', 'Distribution', 'AlgorithmGroup',
+                       'AlgorithmType', 'AlgorithmVariant', 'AlgorithmName')
+
+# Define algorithm friendly names globally
+algorithm_names = {
+    'CLOSEST_PAIR_NAIVE': 'Naive O(n²)',
+    'CLOSEST_PAIR_EFFICIENT': 'Divide & Conquer',
+    'CLOSEST_PAIR_KDTREE': 'KD-Tree',
+    'CLOSEST_PAIR_ADAPTIVE': 'Adaptive',
+    'DIAMETER_NAIVE': 'Naive O(n²)',
+    'DIAMETER_CONCURRENT': 'Concurrent',
+    'DIAMETER_QUICKHULL': 'QuickHull'
+}
+
 def ensure_dir(directory):
     """Ensure a directory exists; create it if it doesn't."""
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    # exist_ok avoids a race when several plotting processes create it at once
+    os.makedirs(directory, exist_ok=True)
 
 def find_latest_benchmark_file():
     """Find the most recent benchmark CSV file."""
@@ -52,51 +75,141 @@ def load_and_prepare_data(file_path=None):
     if file_path is None:
         file_path = find_latest_benchmark_file()
     
+    # Reuse the prepared frame from a previous run unless the CSV, or this
+    # script's preparation steps, changed since it was written
+    cache_path = file_path + '.feather'
+    source_mtime = max(os.path.getmtime(file_path), os.path.getmtime(__file__))
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= source_mtime:
+        print(f"Loading cached benchmark data from: {cache_path}")
+        try:
+            df = pd.read_feather(cache_path, dtype_backend='pyarrow')
+        except (OSError, pa.ArrowException) as e:
+            # A truncated or unreadable cache is rebuilt from the CSV below
+            print(f"Could not read benchmark cache {cache_path}, reloading the CSV: {e}")
+        else:
+            # The Arrow backend reads categoricals back as Arrow dictionaries
+            for col in CATEGORICAL_COLUMNS:
+                df[col] = df[col].astype('category')
+            return df
+    
     print(f"Loading benchmark data from: {file_path}")
-    df = pd.read_csv(file_path)
+    # The Arrow reader parses in parallel and infers the numeric columns,
+    # keeping the string columns as Arrow strings instead of Python objects
+    df = pd.read_csv(file_path, engine='pyarrow', dtype_backend='pyarrow')
     
-    # Ensure numeric columns
-    df['Size'] = pd.to_numeric(df['Size'])
-    df['ExecutionTime(ms)'] = pd.to_numeric(df['ExecutionTime(ms)'])
-    df['MemoryUsage(MB)'] = pd.to_numeric(df['MemoryUsage(MB)'])
+    # Point counts and timings fit comfortably in narrower types
+    df['Size'] = pd.to_numeric(df['Size'], downcast='unsigned')
+    df['ExecutionTime(ms)'] = pd.to_numeric(df['ExecutionTime(ms)'], downcast='float')
+    df['MemoryUsage(MB)'] = pd.to_numeric(df['MemoryUsage(MB)'], downcast='float')
     
     # Create algorithm group column (Closest Pair or Diameter)
-    df['AlgorithmGroup'] = df['Algorithm'].apply(
-        lambda x: 'Closest Pair' if 'CLOSEST_PAIR' in x else 'Diameter'
+    df['AlgorithmGroup'] = np.where(
+        df['Algorithm'].str.contains('CLOSEST_PAIR'), 'Closest Pair', 'Diameter'
     )
     
     # Create algorithm type column (without dimension)
-    df['AlgorithmType'] = df['Algorithm'].apply(
-        lambda x: x.split('_')[0] if x.split('_')[0] == 'DIAMETER' else '_'.join(x.split('_')[0:2])
-    )
+    parts = df['Algorithm'].str.split('_', n=2, expand=True)
+    is_diam = parts[0].eq('DIAMETER')
+    df['AlgorithmType'] = np.where(is_diam, parts[0], parts[0] + '_' + parts[1])
     
     # Create algorithm variant column
-    df['AlgorithmVariant'] = df['Algorithm'].apply(
-        lambda x: x.split('_')[-1] if x.split('_')[0] == 'DIAMETER' else x.split('_')[-1]
-    )
-    
-    # Add logarithmic execution time for better visualization
-    df['LogExecutionTime'] = np.log10(df['ExecutionTime(ms)'])
+    df['AlgorithmVariant'] = df['Algorithm'].str.rsplit('_', n=1, expand=True)[1]
     
     # Add an algorithm friendly name for better labels
-    algorithm_names = {
-        'CLOSEST_PAIR_NAIVE': 'Naive O(n²)',
-        'CLOSEST_PAIR_EFFICIENT': 'Divide & Conquer',
-        'CLOSEST_PAIR_KDTREE': 'KD-Tree',
-        'CLOSEST_PAIR_ADAPTIVE': 'Adaptive',
-        'DIAMETER_NAIVE': 'Naive O(n²)',
-        'DIAMETER_CONCURRENT': 'Concurrent',
-        'DIAMETER_QUICKHULL': 'QuickHull'
-    }
-    df['AlgorithmName'] = df['Algorithm'].apply(lambda x: algorithm_names.get(x, x))
+    df['AlgorithmName'] = df['Algorithm'].map(algorithm_names).fillna(df['Algorithm'])
+    
+    # np.where and map produce NumPy strings; use Arrow strings like the CSV
+    # columns so fresh and cached loads end up with the same categories
+    for col in ('AlgorithmGroup', 'AlgorithmType', 'AlgorithmName'):
+        df[col] = df[col].astype(pd.ArrowDtype(pa.string()))
+    
+    # Categorical keys let every later groupby hash integer codes instead of strings
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype('category')
+    
+    # Cache the prepared frame so later runs skip parsing and derivation; it is
+    # written beside the cache and moved into place so a killed run can't leave
+    # a partial file behind
+    tmp_path = f"{file_path}.{os.getpid()}.tmp.feather"
+    try:
+        df.reset_index(drop=True).to_feather(tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except (OSError, pa.ArrowException) as e:
+        print(f"Could not write benchmark cache {cache_path}: {e}")
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
     
     return df
 
-def plot_time_complexity_by_dimension(df):
+def _ref_lines(xmin, xmax, ymax):
+    """Return (x, O(n), O(n log n), O(n²)) reference curves spanning the given size range."""
+    x_range = np.linspace(xmin, xmax, 100)
+    scale_factor = ymax / (xmax**2) * 0.1
+    return (x_range, scale_factor * x_range,
+            scale_factor * x_range * np.log(x_range), scale_factor * x_range**2)
+
+def _run_weighted_mean(data, keys, value):
+    """Average the per-cell means of value over keys, weighting each cell by its run count."""
+    # A plain mean of means would over-weight cells where some runs failed
+    totals = data[keys].assign(**{value: data[value] * data['Runs'], 'Runs': data['Runs']})
+    sums = totals.groupby(keys, observed=True, sort=False)[[value, 'Runs']].sum()
+    return sums[value].div(sums['Runs']).rename(value).reset_index()
+
+def _group_slice(data, dimension, algo_group):
+    """Return the rows of data for one dimension and algorithm group."""
+    return data[(data['Dimension'] == dimension) & (data['AlgorithmGroup'] == algo_group)]
+
+def _plot_wide_lines(wide, ax, loglog=False, **kwargs):
+    """Draw one line per column of a Size-indexed pivot, connecting only the sizes each column has."""
+    # A pivot leaves NaN where one algorithm lacks a size its group-mates have;
+    # dropping it per column keeps that line connected instead of broken
+    for name, column in wide.items():
+        column = column.dropna()
+        ax.plot(column.index.to_numpy(), column.to_numpy(), label=name, **kwargs)
+    if loglog:
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+
+def _plot_time_complexity(group_data, dim_label, algo_group, ax_log, ax_linear=None):
+    """Draw execution time vs size for one algorithm group on a log-log axis and, optionally, a linear one."""
+    # Calculate average times for each algorithm/size combination
+    plot_data = _run_weighted_mean(group_data, ['AlgorithmName', 'Size'], 'ExecutionTime(ms)')
+    
+    # One column per algorithm, drawn the same way on each axis
+    wide = plot_data.pivot(index='Size', columns='AlgorithmName', values='ExecutionTime(ms)')
+    
+    # Plot linear scale
+    if ax_linear is not None:
+        _plot_wide_lines(wide, ax_linear, marker='o', linewidth=2)
+        
+        ax_linear.set_title(f'{algo_group} Algorithms - {dim_label} (Linear Scale)')
+        ax_linear.set_xlabel('Number of Points (n)')
+        ax_linear.set_ylabel('Execution Time (ms)')
+        ax_linear.legend()
+        ax_linear.grid(True)
+    
+    # Plot log scale
+    _plot_wide_lines(wide, ax_log, marker='o', linewidth=2, loglog=True)
+    
+    # Add reference lines for common complexity classes
+    x_range, y_linear, y_nlogn, y_n2 = _ref_lines(
+        plot_data['Size'].min(), plot_data['Size'].max(), plot_data['ExecutionTime(ms)'].max())
+    
+    ax_log.loglog(x_range, y_linear, 'k--', alpha=0.5, label='O(n)')
+    ax_log.loglog(x_range, y_nlogn, 'k-.', alpha=0.5, label='O(n log n)')
+    ax_log.loglog(x_range, y_n2, 'k:', alpha=0.5, label='O(n²)')
+    
+    ax_log.set_title(f'{algo_group} Algorithms - {dim_label} (Log-Log Scale)')
+    ax_log.set_xlabel('Number of Points (n)')
+    ax_log.set_ylabel('Execution Time (ms)')
+    ax_log.legend()
+    ax_log.grid(True)
+
+def plot_time_complexity_by_dimension(agg):
     """Plot time complexity (execution time vs size) for each algorithm, separated by dimension."""
     # Create separate plots for 2D and 3D
     for dimension in ['TWO_D', 'THREE_D']:
-        dim_data = df[df['Dimension'] == dimension]
+        dim_data = agg[agg['Dimension'] == dimension]
         dim_label = '2D' if dimension == 'TWO_D' else '3D'
         
         # Create separate plots for Closest Pair and Diameter
@@ -107,64 +220,35 @@ def plot_time_complexity_by_dimension(df):
             if len(group_data) == 0:
                 continue
             
-            # Calculate average times for each algorithm/size combination
-            plot_data = group_data.groupby(['Algorithm', 'Size'])['ExecutionTime(ms)'].mean().reset_index()
-            
             # Create figure with two side-by-side subplots: Linear and Log scale
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 7))
-            
-            # Get unique algorithms for this group
-            algorithms = plot_data['Algorithm'].unique()
-            
-            # Plot linear scale
-            for algo in algorithms:
-                algo_data = plot_data[plot_data['Algorithm'] == algo]
-                algo_name = algorithm_names.get(algo, algo)
-                ax1.plot(algo_data['Size'], algo_data['ExecutionTime(ms)'], 
-                         marker='o', linewidth=2, label=algo_name)
-            
-            ax1.set_title(f'{algo_group} Algorithms - {dim_label} (Linear Scale)')
-            ax1.set_xlabel('Number of Points (n)')
-            ax1.set_ylabel('Execution Time (ms)')
-            ax1.legend()
-            ax1.grid(True)
-            
-            # Plot log scale
-            for algo in algorithms:
-                algo_data = plot_data[plot_data['Algorithm'] == algo]
-                algo_name = algorithm_names.get(algo, algo)
-                ax2.loglog(algo_data['Size'], algo_data['ExecutionTime(ms)'], 
-                           marker='o', linewidth=2, label=algo_name)
-            
-            # Add reference lines for common complexity classes
-            x_range = np.linspace(min(plot_data['Size']), max(plot_data['Size']), 100)
-            scale_factor = plot_data['ExecutionTime(ms)'].max() / (max(plot_data['Size'])**2) * 0.1
-            
-            ax2.loglog(x_range, scale_factor * x_range, 'k--', alpha=0.5, label='O(n)')
-            ax2.loglog(x_range, scale_factor * x_range * np.log(x_range), 'k-.', alpha=0.5, label='O(n log n)')
-            ax2.loglog(x_range, scale_factor * x_range**2, 'k:', alpha=0.5, label='O(n²)')
-            
-            ax2.set_title(f'{algo_group} Algorithms - {dim_label} (Log-Log Scale)')
-            ax2.set_xlabel('Number of Points (n)')
-            ax2.set_ylabel('Execution Time (ms)')
-            ax2.legend()
-            ax2.grid(True)
-            
-            plt.tight_layout()
+            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 7), layout='constrained')
+            _plot_time_complexity(group_data, dim_label, algo_group, ax2, ax_linear=ax1)
             
             # Save figure
             ensure_dir(IMAGES_DIR)
             fig.savefig(f"{IMAGES_DIR}/{dim_label}_{algo_group.replace(' ', '')}_complexity.png", dpi=DPI)
             plt.close(fig)
 
-def plot_distribution_comparison(df):
+def _plot_distribution_bars(group_data, dim_label, algo_group, max_size, ax):
+    """Draw one bar per distribution for each algorithm of a group at the largest size."""
+    # Pivot the data for plotting
+    pivot_data = group_data.pivot(index='Algorithm', columns='Distribution', values='ExecutionTime(ms)')
+    pivot_data.plot(kind='bar', ax=ax)
+    
+    ax.set_title(f'{algo_group} Algorithms - {dim_label} Distribution Comparison (n={max_size})')
+    ax.set_xlabel('Algorithm')
+    ax.set_ylabel('Execution Time (ms)')
+    ax.tick_params(axis='x', rotation=45)
+    ax.legend(title='Distribution')
+
+def plot_distribution_comparison(agg, max_size=None):
     """Plot comparison of algorithm performance across different distributions."""
     # Focus on the largest size for a fair comparison
-    max_size = df['Size'].max()
-    largest_data = df[df['Size'] == max_size]
+    if max_size is None:
+        max_size = agg['Size'].max()
     
-    # Calculate mean execution time for each algorithm, dimension, and distribution
-    grouped = largest_data.groupby(['Algorithm', 'Dimension', 'Distribution'])['ExecutionTime(ms)'].mean().reset_index()
+    # Already one mean execution time per algorithm, dimension, and distribution
+    grouped = agg[agg['Size'] == max_size]
     
     # Create separate plots for 2D and 3D
     for dimension in ['TWO_D', 'THREE_D']:
@@ -174,35 +258,25 @@ def plot_distribution_comparison(df):
         # Create separate plots for Closest Pair and Diameter
         for algo_group in ['Closest Pair', 'Diameter']:
             # Filter by algorithm group
-            group_data = dim_data[dim_data['Algorithm'].str.contains(
-                'CLOSEST_PAIR' if algo_group == 'Closest Pair' else 'DIAMETER')]
+            group_data = dim_data[dim_data['AlgorithmGroup'] == algo_group]
             
             # Skip if no data for this group
             if len(group_data) == 0:
                 continue
             
-            # Pivot the data for plotting
-            pivot_data = group_data.pivot(index='Algorithm', columns='Distribution', values='ExecutionTime(ms)')
-            
             # Create the bar plot
-            fig, ax = plt.subplots(figsize=(12, 8))
-            pivot_data.plot(kind='bar', ax=ax)
-            
-            plt.title(f'{algo_group} Algorithms - {dim_label} Distribution Comparison (n={max_size})')
-            plt.xlabel('Algorithm')
-            plt.ylabel('Execution Time (ms)')
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            fig, ax = plt.subplots(figsize=(12, 8), layout='constrained')
+            _plot_distribution_bars(group_data, dim_label, algo_group, max_size, ax)
             
             # Save figure
             ensure_dir(IMAGES_DIR)
             fig.savefig(f"{IMAGES_DIR}/{dim_label}_{algo_group.replace(' ', '')}_distributions.png", dpi=DPI)
             plt.close(fig)
 
-def plot_memory_usage(df):
+def plot_memory_usage(agg):
     """Plot memory usage for different algorithms and sizes."""
     # Calculate mean memory usage for each algorithm, dimension, and size
-    grouped = df.groupby(['Algorithm', 'Dimension', 'Size'])['MemoryUsage(MB)'].mean().reset_index()
+    grouped = _run_weighted_mean(agg, ['Algorithm', 'AlgorithmName', 'AlgorithmGroup', 'Dimension', 'Size'], 'MemoryUsage(MB)')
     
     # Create separate plots for 2D and 3D
     for dimension in ['TWO_D', 'THREE_D']:
@@ -212,79 +286,63 @@ def plot_memory_usage(df):
         # Create separate plots for Closest Pair and Diameter
         for algo_group in ['Closest Pair', 'Diameter']:
             # Filter by algorithm group
-            group_data = dim_data[dim_data['Algorithm'].str.contains(
-                'CLOSEST_PAIR' if algo_group == 'Closest Pair' else 'DIAMETER')]
+            group_data = dim_data[dim_data['AlgorithmGroup'] == algo_group]
             
             # Skip if no data for this group
             if len(group_data) == 0:
                 continue
             
             # Create the plot
-            fig, ax = plt.subplots(figsize=(12, 8))
-            
-            # Get unique algorithms for this group
-            algorithms = group_data['Algorithm'].unique()
+            fig, ax = plt.subplots(figsize=(12, 8), layout='constrained')
             
             # Plot memory usage vs size for each algorithm
-            for algo in algorithms:
-                algo_data = group_data[group_data['Algorithm'] == algo]
-                algo_name = algorithm_names.get(algo, algo)
-                ax.plot(algo_data['Size'], algo_data['MemoryUsage(MB)'], 
-                        marker='o', linewidth=2, label=algo_name)
+            wide = group_data.pivot(index='Size', columns='AlgorithmName', values='MemoryUsage(MB)')
+            _plot_wide_lines(wide, ax, marker='o', linewidth=2)
             
             plt.title(f'{algo_group} Algorithms - {dim_label} Memory Usage')
             plt.xlabel('Number of Points (n)')
             plt.ylabel('Memory Usage (MB)')
             plt.legend()
             plt.grid(True)
-            plt.tight_layout()
             
             # Save figure
             ensure_dir(IMAGES_DIR)
             fig.savefig(f"{IMAGES_DIR}/{dim_label}_{algo_group.replace(' ', '')}_memory.png", dpi=DPI)
             plt.close(fig)
 
-def plot_dimension_comparison(df):
+def plot_dimension_comparison(agg):
     """Compare algorithm performance across dimensions (2D vs 3D)."""
     # Calculate mean execution time for each algorithm, dimension, and size
-    grouped = df.groupby(['Algorithm', 'AlgorithmName', 'Dimension', 'Size'])['ExecutionTime(ms)'].mean().reset_index()
+    grouped = _run_weighted_mean(agg, ['Algorithm', 'AlgorithmName', 'Dimension', 'Size'], 'ExecutionTime(ms)')
     
     # Create separate plots for each algorithm
-    for algo in grouped['Algorithm'].unique():
-        algo_data = grouped[grouped['Algorithm'] == algo]
-        algo_name = algo_data['AlgorithmName'].iloc[0]
+    for algo, algo_data in grouped.groupby('Algorithm', observed=True, sort=False):
+        algo_name = algo_data['AlgorithmName'].iat[0]
         
         # Create the plot
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8), layout='constrained')
         
-        # Plot 2D and 3D performance
-        for dimension in ['TWO_D', 'THREE_D']:
-            dim_data = algo_data[algo_data['Dimension'] == dimension]
-            dim_label = '2D' if dimension == 'TWO_D' else '3D'
-            
-            if len(dim_data) > 0:
-                ax.plot(dim_data['Size'], dim_data['ExecutionTime(ms)'], 
-                        marker='o', linewidth=2, label=dim_label)
+        # Plot 2D and 3D performance, in that order, for the dimensions present
+        wide = algo_data.pivot(index='Size', columns='Dimension', values='ExecutionTime(ms)')
+        wide = wide[[dim for dim in ['TWO_D', 'THREE_D'] if dim in wide.columns]]
+        _plot_wide_lines(wide.rename(columns={'TWO_D': '2D', 'THREE_D': '3D'}), ax, marker='o', linewidth=2)
         
         plt.title(f'{algo_name} - 2D vs 3D Performance Comparison')
         plt.xlabel('Number of Points (n)')
         plt.ylabel('Execution Time (ms)')
         plt.legend()
         plt.grid(True)
-        plt.tight_layout()
         
         # Save figure
         ensure_dir(IMAGES_DIR)
         fig.savefig(f"{IMAGES_DIR}/{algo}_dimension_comparison.png", dpi=DPI)
         plt.close(fig)
 
-def plot_performance_heatmap(df):
+def plot_performance_heatmap(agg):
     """Create heatmaps showing relative performance of algorithms."""
-    # Focus on a specific distribution (e.g., UNIFORM)
-    uniform_data = df[df['Distribution'] == 'UNIFORM']
-    
-    # Calculate mean execution time for each algorithm, dimension, and size
-    grouped = uniform_data.groupby(['Algorithm', 'AlgorithmName', 'Dimension', 'Size'])['ExecutionTime(ms)'].mean().reset_index()
+    # Focus on a specific distribution (e.g., UNIFORM); this leaves one mean
+    # execution time per algorithm, dimension, and size
+    grouped = agg[agg['Distribution'] == 'UNIFORM']
     
     # Create separate heatmaps for 2D and 3D
     for dimension in ['TWO_D', 'THREE_D']:
@@ -294,294 +352,157 @@ def plot_performance_heatmap(df):
         # Create separate heatmaps for Closest Pair and Diameter
         for algo_group in ['Closest Pair', 'Diameter']:
             # Filter by algorithm group
-            group_data = dim_data[dim_data['Algorithm'].str.contains(
-                'CLOSEST_PAIR' if algo_group == 'Closest Pair' else 'DIAMETER')]
+            group_data = dim_data[dim_data['AlgorithmGroup'] == algo_group]
             
             # Skip if no data for this group
             if len(group_data) == 0:
                 continue
             
             # Pivot data for heatmap
-            pivot_data = group_data.pivot(index='Size', columns='AlgorithmName', values='ExecutionTime(ms)')
+            # seaborn needs a NumPy float matrix, not Arrow-backed columns
+            pivot_data = group_data.pivot(index='Size', columns='AlgorithmName', values='ExecutionTime(ms)').astype('float64')
             
             # Create the heatmap
-            fig, ax = plt.subplots(figsize=(12, 10))
+            fig, ax = plt.subplots(figsize=(12, 10), layout='constrained')
             sns.heatmap(pivot_data, annot=True, fmt='.1f', cmap='viridis', ax=ax)
             
             plt.title(f'{algo_group} Algorithms - {dim_label} Performance Heatmap (UNIFORM)')
             plt.ylabel('Number of Points (n)')
             plt.xlabel('Algorithm')
-            plt.tight_layout()
             
             # Save figure
             ensure_dir(IMAGES_DIR)
             fig.savefig(f"{IMAGES_DIR}/{dim_label}_{algo_group.replace(' ', '')}_heatmap.png", dpi=DPI)
             plt.close(fig)
 
-def plot_relative_speedup(df):
-    """Plot relative speedup of optimized algorithms compared to naive implementation."""
-    # Calculate mean execution time for each algorithm, dimension, and size
-    grouped = df.groupby(['Algorithm', 'AlgorithmName', 'Dimension', 'Size', 'Distribution'])['ExecutionTime(ms)'].mean().reset_index()
+def _speedup_vs_naive(data, naive_algo, index='Size'):
+    """Return naive time / algorithm time per index row, one column per non-naive algorithm, labelled by display name."""
+    # One column per algorithm, so every speedup is a single division by the naive column
+    pivot_data = data.pivot_table(index=index, columns=['Algorithm', 'AlgorithmName'],
+                                  values='ExecutionTime(ms)', aggfunc='mean', observed=True)
+    is_naive = pivot_data.columns.get_level_values('Algorithm') == naive_algo
+    if is_naive.any():
+        speedup = pivot_data.loc[:, ~is_naive].rdiv(pivot_data.loc[:, is_naive].iloc[:, 0], axis=0)
+    else:
+        speedup = pivot_data.iloc[:, :0]
+    speedup.columns = speedup.columns.get_level_values('AlgorithmName')
+    return speedup
+
+def _plot_speedup_lines(speedup, ax, label_prefix='', linestyle='-'):
+    """Draw one speedup line per column of a _speedup_vs_naive frame."""
+    sizes = speedup.index.get_level_values('Size')
+    for algo_name, algo_speedup in speedup.items():
+        ax.plot(sizes, algo_speedup, 
+                marker='o', linewidth=2, linestyle=linestyle,
+                label=f"{label_prefix}{algo_name}")
+
+def _finish_speedup_axes(ax, title):
+    """Label a speedup axis and mark the no-speedup baseline."""
+    ax.set_title(title)
+    ax.set_xlabel('Number of Points (n)')
+    ax.set_ylabel('Speedup Factor (higher is better)')
+    ax.legend()
+    ax.grid(True)
     
+    # Add horizontal line at y=1 (no speedup)
+    ax.axhline(y=1, color='r', linestyle='--', alpha=0.5)
+
+def plot_relative_speedup(agg):
+    """Plot relative speedup of optimized algorithms compared to naive implementation."""
     # Create separate plots for 2D and 3D
     for dimension in ['TWO_D', 'THREE_D']:
-        dim_data = grouped[grouped['Dimension'] == dimension]
+        dim_data = agg[agg['Dimension'] == dimension]
         dim_label = '2D' if dimension == 'TWO_D' else '3D'
         
         # Create separate plots for Closest Pair and Diameter
         for algo_group in ['Closest Pair', 'Diameter']:
             # Filter by algorithm group
-            if algo_group == 'Closest Pair':
-                group_data = dim_data[dim_data['Algorithm'].str.contains('CLOSEST_PAIR')]
-                naive_algo = 'CLOSEST_PAIR_NAIVE'
-            else:
-                group_data = dim_data[dim_data['Algorithm'].str.contains('DIAMETER')]
-                naive_algo = 'DIAMETER_NAIVE'
+            group_data = dim_data[dim_data['AlgorithmGroup'] == algo_group]
+            naive_algo = 'CLOSEST_PAIR_NAIVE' if algo_group == 'Closest Pair' else 'DIAMETER_NAIVE'
             
             # Skip if no data for this group or if naive algorithm is missing
             if len(group_data) == 0 or not any(group_data['Algorithm'] == naive_algo):
                 continue
             
+            speedup = _speedup_vs_naive(group_data, naive_algo, index=['Size', 'Distribution'])
+            
             # Process each distribution
-            for dist in group_data['Distribution'].unique():
-                dist_data = group_data[group_data['Distribution'] == dist]
+            for dist, dist_speedup in speedup.groupby(level='Distribution', observed=True, sort=False):
+                fig, ax = plt.subplots(figsize=(12, 8), layout='constrained')
                 
-                fig, ax = plt.subplots(figsize=(12, 8))
-                
-                # Get naive algorithm times for reference
-                naive_data = dist_data[dist_data['Algorithm'] == naive_algo]
-                
-                # Calculate speedup for each algorithm relative to naive
-                for algo in dist_data['Algorithm'].unique():
-                    if algo == naive_algo:
-                        continue
-                    
-                    algo_data = dist_data[dist_data['Algorithm'] == algo]
-                    
-                    # Merge with naive data to calculate speedup
-                    merged_data = pd.merge(
-                        algo_data, 
-                        naive_data[['Size', 'ExecutionTime(ms)']],
-                        on='Size',
-                        suffixes=('', '_naive')
-                    )
-                    
-                    # Calculate speedup
-                    merged_data['Speedup'] = merged_data['ExecutionTime(ms)_naive'] / merged_data['ExecutionTime(ms)']
-                    
-                    # Plot speedup
-                    ax.plot(merged_data['Size'], merged_data['Speedup'], 
-                            marker='o', linewidth=2, label=algorithm_names.get(algo, algo))
-                
-                plt.title(f'{algo_group} Algorithms - {dim_label} Speedup vs Naive ({dist})')
-                plt.xlabel('Number of Points (n)')
-                plt.ylabel('Speedup Factor (higher is better)')
-                plt.legend()
-                plt.grid(True)
-                
-                # Add horizontal line at y=1 (no speedup)
-                plt.axhline(y=1, color='r', linestyle='--', alpha=0.5)
-                
-                plt.tight_layout()
+                # Plot speedup for each algorithm relative to naive
+                _plot_speedup_lines(dist_speedup, ax)
+                _finish_speedup_axes(ax, f'{algo_group} Algorithms - {dim_label} Speedup vs Naive ({dist})')
                 
                 # Save figure
                 ensure_dir(IMAGES_DIR)
                 fig.savefig(f"{IMAGES_DIR}/{dim_label}_{algo_group.replace(' ', '')}_{dist}_speedup.png", dpi=DPI)
                 plt.close(fig)
 
-def create_unified_dashboard(df):
+def create_unified_dashboard(agg, max_size=None):
     """Create unified dashboard with key performance metrics."""
-    # Create a single large figure with multiple subplots
-    fig = plt.figure(figsize=(24, 20))
+    # Create a single large figure with multiple subplots; the constrained
+    # layout also leaves room for the suptitle
+    fig = plt.figure(figsize=(24, 20), layout='constrained')
     gs = gridspec.GridSpec(4, 4, figure=fig)
     
     # 1. Time complexity (2D Closest Pair)
     ax1 = fig.add_subplot(gs[0, :2])
-    plot_time_complexity_dashboard(df, 'TWO_D', 'Closest Pair', ax1)
+    _plot_time_complexity(_group_slice(agg, 'TWO_D', 'Closest Pair'), '2D', 'Closest Pair', ax1)
     
     # 2. Time complexity (3D Closest Pair)
     ax2 = fig.add_subplot(gs[0, 2:])
-    plot_time_complexity_dashboard(df, 'THREE_D', 'Closest Pair', ax2)
+    _plot_time_complexity(_group_slice(agg, 'THREE_D', 'Closest Pair'), '3D', 'Closest Pair', ax2)
     
     # 3. Time complexity (2D Diameter)
     ax3 = fig.add_subplot(gs[1, :2])
-    plot_time_complexity_dashboard(df, 'TWO_D', 'Diameter', ax3)
+    _plot_time_complexity(_group_slice(agg, 'TWO_D', 'Diameter'), '2D', 'Diameter', ax3)
     
     # 4. Time complexity (3D Diameter)
     ax4 = fig.add_subplot(gs[1, 2:])
-    plot_time_complexity_dashboard(df, 'THREE_D', 'Diameter', ax4)
+    _plot_time_complexity(_group_slice(agg, 'THREE_D', 'Diameter'), '3D', 'Diameter', ax4)
+    
+    # Focus on the largest size for a fair distribution comparison
+    if max_size is None:
+        max_size = agg['Size'].max()
+    largest_data = agg[agg['Size'] == max_size]
     
     # 5. Distribution comparison (2D Closest Pair)
     ax5 = fig.add_subplot(gs[2, :2])
-    plot_distribution_dashboard(df, 'TWO_D', 'Closest Pair', ax5)
+    _plot_distribution_bars(_group_slice(largest_data, 'TWO_D', 'Closest Pair'), '2D', 'Closest Pair', max_size, ax5)
     
     # 6. Distribution comparison (3D Closest Pair)
     ax6 = fig.add_subplot(gs[2, 2:])
-    plot_distribution_dashboard(df, 'THREE_D', 'Closest Pair', ax6)
-    
-    # 7. Speedup comparison (2D)
-    ax7 = fig.add_subplot(gs[3, :2])
-    plot_speedup_dashboard(df, 'TWO_D', ax7)
-    
-    # 8. Speedup comparison (3D)
-    ax8 = fig.add_subplot(gs[3, 2:])
-    plot_speedup_dashboard(df, 'THREE_D', ax8)
+    _plot_distribution_bars(_group_slice(largest_data, 'THREE_D', 'Closest Pair'), '3D', 'Closest Pair', max_size, ax6)
+    
+    # 7-8. Speedup comparison (2D and 3D), UNIFORM only for clarity;
+    # Closest Pair with dashed lines, Diameter with solid lines
+    uniform_data = agg[agg['Distribution'] == 'UNIFORM']
+    for cell, dimension, dim_label in ((gs[3, :2], 'TWO_D', '2D'), (gs[3, 2:], 'THREE_D', '3D')):
+        ax = fig.add_subplot(cell)
+        cp_speedup = _speedup_vs_naive(_group_slice(uniform_data, dimension, 'Closest Pair'), 'CLOSEST_PAIR_NAIVE')
+        dm_speedup = _speedup_vs_naive(_group_slice(uniform_data, dimension, 'Diameter'), 'DIAMETER_NAIVE')
+        _plot_speedup_lines(cp_speedup, ax, label_prefix='CP: ', linestyle='--')
+        _plot_speedup_lines(dm_speedup, ax, label_prefix='DM: ')
+        _finish_speedup_axes(ax, f'{dim_label} Algorithm Speedup vs Naive (UNIFORM)')
     
     plt.suptitle('Point Cloud Algorithm Performance Dashboard', fontsize=24)
-    plt.tight_layout(rect=[0, 0, 1, 0.97])
     
     # Save figure
     ensure_dir(IMAGES_DIR)
-    fig.savefig(f"{IMAGES_DIR}/performance_dashboard.png", dpi=DPI)
+    fig.savefig(f"{IMAGES_DIR}/performance_dashboard.png", dpi=DASHBOARD_DPI)
     plt.close(fig)
 
-def plot_time_complexity_dashboard(df, dimension, algo_group, ax):
-    """Helper function to plot time complexity for the dashboard."""
-    dim_data = df[df['Dimension'] == dimension]
-    dim_label = '2D' if dimension == 'TWO_D' else '3D'
-    
-    # Filter by algorithm group
-    group_data = dim_data[dim_data['Algorithm'].str.contains(
-        'CLOSEST_PAIR' if algo_group == 'Closest Pair' else 'DIAMETER')]
-    
-    # Calculate average times for each algorithm/size combination
-    plot_data = group_data.groupby(['Algorithm', 'Size'])['ExecutionTime(ms)'].mean().reset_index()
-    
-    # Get unique algorithms for this group
-    algorithms = plot_data['Algorithm'].unique()
-    
-    # Plot log-log scale
-    for algo in algorithms:
-        algo_data = plot_data[plot_data['Algorithm'] == algo]
-        algo_name = algorithm_names.get(algo, algo)
-        ax.loglog(algo_data['Size'], algo_data['ExecutionTime(ms)'], 
-                   marker='o', linewidth=2, label=algo_name)
-    
-    # Add reference lines for common complexity classes
-    x_range = np.linspace(min(plot_data['Size']), max(plot_data['Size']), 100)
-    scale_factor = plot_data['ExecutionTime(ms)'].max() / (max(plot_data['Size'])**2) * 0.1
-    
-    ax.loglog(x_range, scale_factor * x_range, 'k--', alpha=0.5, label='O(n)')
-    ax.loglog(x_range, scale_factor * x_range * np.log(x_range), 'k-.', alpha=0.5, label='O(n log n)')
-    ax.loglog(x_range, scale_factor * x_range**2, 'k:', alpha=0.5, label='O(n²)')
-    
-    ax.set_title(f'{algo_group} Algorithms - {dim_label} (Log-Log Scale)')
-    ax.set_xlabel('Number of Points (n)')
-    ax.set_ylabel('Execution Time (ms)')
-    ax.legend()
-    ax.grid(True)
-
-def plot_distribution_dashboard(df, dimension, algo_group, ax):
-    """Helper function to plot distribution comparison for the dashboard."""
-    # Focus on the largest size for a fair comparison
-    max_size = df['Size'].max()
-    largest_data = df[df['Size'] == max_size]
-    
-    dim_data = largest_data[largest_data['Dimension'] == dimension]
-    dim_label = '2D' if dimension == 'TWO_D' else '3D'
-    
-    # Calculate mean execution time for each algorithm and distribution
-    group_data = dim_data[dim_data['Algorithm'].str.contains(
-        'CLOSEST_PAIR' if algo_group == 'Closest Pair' else 'DIAMETER')]
-    
-    grouped = group_data.groupby(['Algorithm', 'Distribution'])['ExecutionTime(ms)'].mean().reset_index()
-    
-    # Pivot the data for plotting
-    pivot_data = grouped.pivot(index='Algorithm', columns='Distribution', values='ExecutionTime(ms)')
-    
-    # Create the bar plot
-    pivot_data.plot(kind='bar', ax=ax)
-    
-    ax.set_title(f'{algo_group} Algorithms - {dim_label} Distribution Comparison (n={max_size})')
-    ax.set_xlabel('Algorithm')
-    ax.set_ylabel('Execution Time (ms)')
-    ax.tick_params(axis='x', rotation=45)
-    ax.legend(title='Distribution')
-
-def plot_speedup_dashboard(df, dimension, ax):
-    """Helper function to plot speedup comparison for the dashboard."""
-    dim_data = df[df['Dimension'] == dimension]
-    dim_label = '2D' if dimension == 'TWO_D' else '3D'
-    
-    # Use only UNIFORM distribution for clarity
-    uniform_data = dim_data[dim_data['Distribution'] == 'UNIFORM']
-    
-    # Calculate mean execution time for each algorithm and size
-    grouped = uniform_data.groupby(['Algorithm', 'AlgorithmName', 'Size'])['ExecutionTime(ms)'].mean().reset_index()
-    
-    # Split into Closest Pair and Diameter
-    cp_data = grouped[grouped['Algorithm'].str.contains('CLOSEST_PAIR')]
-    dm_data = grouped[grouped['Algorithm'].str.contains('DIAMETER')]
-    
-    # Get naive algorithm times
-    cp_naive = cp_data[cp_data['Algorithm'] == 'CLOSEST_PAIR_NAIVE']
-    dm_naive = dm_data[dm_data['Algorithm'] == 'DIAMETER_NAIVE']
-    
-    # Plot speedup for Closest Pair algorithms
-    for algo in cp_data['Algorithm'].unique():
-        if algo == 'CLOSEST_PAIR_NAIVE':
-            continue
-        
-        algo_data = cp_data[cp_data['Algorithm'] == algo]
-        
-        # Merge with naive data
-        merged_data = pd.merge(
-            algo_data, 
-            cp_naive[['Size', 'ExecutionTime(ms)']],
-            on='Size',
-            suffixes=('', '_naive')
-        )
-        
-        # Calculate speedup
-        merged_data['Speedup'] = merged_data['ExecutionTime(ms)_naive'] / merged_data['ExecutionTime(ms)']
-        
-        # Plot with dashed line
-        ax.plot(merged_data['Size'], merged_data['Speedup'], 
-                marker='o', linewidth=2, linestyle='--',
-                label=f"CP: {algorithm_names.get(algo, algo)}")
-    
-    # Plot speedup for Diameter algorithms
-    for algo in dm_data['Algorithm'].unique():
-        if algo == 'DIAMETER_NAIVE':
-            continue
-        
-        algo_data = dm_data[dm_data['Algorithm'] == algo]
-        
-        # Merge with naive data
-        merged_data = pd.merge(
-            algo_data, 
-            dm_naive[['Size', 'ExecutionTime(ms)']],
-            on='Size',
-            suffixes=('', '_naive')
-        )
-        
-        # Calculate speedup
-        merged_data['Speedup'] = merged_data['ExecutionTime(ms)_naive'] / merged_data['ExecutionTime(ms)']
-        
-        # Plot with solid line
-        ax.plot(merged_data['Size'], merged_data['Speedup'], 
-                marker='o', linewidth=2,
-                label=f"DM: {algorithm_names.get(algo, algo)}")
-    
-    ax.set_title(f'{dim_label} Algorithm Speedup vs Naive (UNIFORM)')
-    ax.set_xlabel('Number of Points (n)')
-    ax.set_ylabel('Speedup Factor (higher is better)')
-    ax.legend()
-    ax.grid(True)
-    
-    # Add horizontal line at y=1 (no speedup)
-    ax.axhline(y=1, color='r', linestyle='--', alpha=0.5)
-
-# Define algorithm friendly names globally
-algorithm_names = {
-    'CLOSEST_PAIR_NAIVE': 'Naive O(n²)',
-    'CLOSEST_PAIR_EFFICIENT': 'Divide & Conquer',
-    'CLOSEST_PAIR_KDTREE': 'KD-Tree',
-    'CLOSEST_PAIR_ADAPTIVE': 'Adaptive',
-    'DIAMETER_NAIVE': 'Naive O(n²)',
-    'DIAMETER_CONCURRENT': 'Concurrent',
-    'DIAMETER_QUICKHULL': 'QuickHull'
-}
+# Top-level plot functions run by main; module-level so worker processes can unpickle them
+PLOT_FUNCTIONS = (
+    plot_time_complexity_by_dimension,
+    plot_distribution_comparison,
+    plot_memory_usage,
+    plot_dimension_comparison,
+    plot_performance_heatmap,
+    plot_relative_speedup,
+    create_unified_dashboard,
+)
 
 def main():
     """Main function to generate all plots."""
@@ -594,14 +515,32 @@ def main():
         
         print(f"Generating plots for {len(df)} benchmark records...")
         
-        # Generate all plots
-        plot_time_complexity_by_dimension(df)
-        plot_distribution_comparison(df)
-        plot_memory_usage(df)
-        plot_dimension_comparison(df)
-        plot_performance_heatmap(df)
-        plot_relative_speedup(df)
-        create_unified_dashboard(df)
+        # Average the runs once per (algorithm, dimension, distribution, size);
+        # every plot aggregates further from this much smaller frame. Keep this
+        # groupby sorted so the frame is ordered by size within each key, which
+        # lets the plot functions group with sort=False and still draw in order
+        runs = df.groupby(
+            ['Algorithm', 'AlgorithmGroup', 'AlgorithmName', 'Dimension', 'Distribution', 'Size'],
+            observed=True
+        )
+        agg = runs[['ExecutionTime(ms)', 'MemoryUsage(MB)']].mean()
+        # Run counts let the coarser plots weight each cell's mean correctly
+        agg['Runs'] = runs.size()
+        agg = agg.reset_index()
+        
+        # Scan once for the plots that compare algorithms at the largest size
+        max_size = agg['Size'].max()
+        plot_kwargs = {
+            plot_distribution_comparison: {'max_size': max_size},
+            create_unified_dashboard: {'max_size': max_size},
+        }
+        
+        # Generate all plots; they are independent, so render them in parallel
+        with ProcessPoolExecutor() as executor:
+            futures = [executor.submit(plot_fn, agg, **plot_kwargs.get(plot_fn, {}))
+                       for plot_fn in PLOT_FUNCTIONS]
+            for future in futures:
+                future.result()
         
         print(f"Plotting complete. Check the '{IMAGES_DIR}' directory for the generated visualizations.")
         